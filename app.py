@@ -875,6 +875,8 @@ with st.sidebar:
 # -----------------------------------
 # 공통 유틸
 # -----------------------------------
+# 인증된 client는 프로세스 단위로 1회만 생성 (JWT 서명/토큰 교환 반복 방지)
+@st.cache_resource
 def get_gspread_client():
     scope = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
     creds = Credentials.from_service_account_info(
@@ -883,6 +885,7 @@ def get_gspread_client():
     return gspread.authorize(creds)
 
 # [신규] 쓰기 권한 포함 gspread 클라이언트 (AUTH_MASTER 업데이트용)
+@st.cache_resource
 def get_gspread_client_rw():
     scope = [
         "https://www.googleapis.com/auth/spreadsheets",
@@ -893,14 +896,17 @@ def get_gspread_client_rw():
     )
     return gspread.authorize(creds)
 
+@st.cache_resource
+def get_spreadsheet(sh_id):
+    """읽기 전용 Spreadsheet 핸들 (open_by_key 메타데이터 조회도 1회만 수행)"""
+    return get_gspread_client().open_by_key(sh_id)
+
 @st.cache_data(ttl=1800)
 def load_cost_input(sh_id):
     """COST_INPUT 시트 로드.
-    (sh_id를 인자로 받아 내부에서 client 생성 - 캐시 효율성 위해)
+    (sh_id를 인자로 받아 캐시된 Spreadsheet 핸들 사용 - 캐시 효율성 위해)
     """
-    client = get_gspread_client()
-    sh   = client.open_by_key(sh_id)
-    ws   = sh.worksheet("COST_INPUT")
+    ws   = get_spreadsheet(sh_id).worksheet("COST_INPUT")
     data = ws.get_all_values()
     if len(data) < 2:
         return {}, {}
@@ -962,10 +968,8 @@ def load_cost_input(sh_id):
 @st.cache_data(ttl=1800)
 def load_channel_cost(sh_id):
     """CHANNEL_COST 시트 로드."""
-    client = get_gspread_client()
     try:
-        sh   = client.open_by_key(sh_id)
-        ws   = sh.worksheet("CHANNEL_COST")
+        ws   = get_spreadsheet(sh_id).worksheet("CHANNEL_COST")
         data = ws.get_all_values()
     except Exception:
         return {}
@@ -993,19 +997,60 @@ def clean_numeric(series: pd.Series) -> pd.Series:
         errors="coerce"
     )
 
+def downcast_qty(series: pd.Series) -> pd.Series:
+    """수량 컬럼이 모두 정수이고 int32 범위 안이면 int32로 축소 (소수·범위 초과 시 float64 유지)"""
+    # int8/int16까지 내리면 이후 수량×단가 등 산술에서 오버플로 → int32로 고정, 범위는 직접 검사
+    if (
+        len(series)
+        and (series % 1 == 0).all()
+        and series.abs().max() <= np.iinfo("int32").max
+    ):
+        return series.astype("int32")
+    return series
+
 def sort_month_cols(cols):
     return sorted(cols, key=lambda x: pd.to_datetime(f"{x}-01", errors="coerce"))
 
+def codes_isin(codes: np.ndarray, categories: pd.Index, values) -> np.ndarray:
+    """범주형 codes 기반 isin. categories 길이의 bool 룩업 벡터를 만든 뒤 codes로 1회 gather.
+    룩업 마지막 칸(False)은 결측 code(-1)용."""
+    lookup = np.zeros(len(categories) + 1, dtype=bool)
+    idx = categories.get_indexer(list(values))
+    lookup[idx[idx >= 0]] = True
+    return lookup[codes]
+
+def present_categories(cat: pd.Categorical, row_pos=None) -> list:
+    """row_pos 행에 실제 등장하는 category 목록 (categories가 이미 정렬 → sorted/unique 불필요, 결측 제외).
+    row_pos=None이면 전체 행 기준 = categories 그대로."""
+    if row_pos is None:
+        return cat.categories.tolist()
+    codes = cat.codes[row_pos]
+    present = np.bincount(codes[codes >= 0], minlength=len(cat.categories)) > 0
+    return cat.categories[present].tolist()
+
 def safe_divide(a, b):
     return np.where(b != 0, a / b, 0)
 
 def make_excel_file(sheet_dict: dict):
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    # xlsxwriter: 순수 Python openpyxl 대비 쓰기 속도·메모리 우수 (쓰기 전용이므로 충분)
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
         for name, df in sheet_dict.items():
             df.to_excel(writer, sheet_name=name[:31])
     return output.getvalue()
 
+def unstack_months(agg: pd.Series, fill_value=0) -> pd.DataFrame:
+    """(키, 출고년월) MultiIndex 합계 Series → 키 × 출고년월 피벗.
+    pd.pivot_table(aggfunc="sum", fill_value=0)과 동일한 결과를 groupby 결과 재사용으로 생성."""
+    return agg.unstack("출고년월", fill_value=fill_value).sort_index()
+
+def int_table_view(table: pd.DataFrame):
+    """정수 표시용 표 → (반올림된 int64 표, column_config).
+    Styler.format("{:,.0f}")의 셀별 HTML 생성 없이 Arrow 그대로 전송, 천 단위 구분은 프론트에서 처리."""
+    view = table.fillna(0).round(0).astype("int64")
+    config = {str(c): st.column_config.NumberColumn(format="localized") for c in view.columns}
+    return view, config
+
 def add_total_row(pivot: pd.DataFrame) -> pd.DataFrame:
     total     = pivot.sum(numeric_only=True)
     total_row = pd.DataFrame([total], index=["[합계]"])
@@ -1105,6 +1150,23 @@ def parse_wms_stock_file(uploaded_file):
 # -----------------------------------
 # 데이터 로드
 # -----------------------------------
+# [최적화] 반복 그룹핑/필터 대상 문자열 컬럼은 PyArrow 기반 string으로 보관
+# (NaN 의미론 유지: == 비교 결과가 numpy bool → 기존 마스크 로직 그대로 동작)
+try:
+    ARROW_STR_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    ARROW_STR_DTYPE = "string[pyarrow_numpy]"
+ARROW_STR_COLS = ["거래처코드", "내품상품명", "출고년월"]
+# 마스터/비용 merge에서 object로 되돌아가는 키 컬럼 → 최종 데이터셋에서 다시 캐스팅
+DATASET_ARROW_STR_COLS = ["거래처분류", "내품상품명", "출고년월"]
+# [최적화] view_table / fin_view_table에서 대시보드가 실제로 쓰는 컬럼만 조회 (SELECT * 대비 전송·파싱량 축소)
+# 품목군·담당부서 등은 마스터 merge로 붙이므로 원천 테이블에서 가져오지 않음
+VIEW_TABLE_COLS = ["출고일자", "출고년월", "거래처코드", "내품상품명", "총내품출고수량", "품목별매출(VAT제외)"]
+VIEW_TABLE_SELECT = ", ".join(f'"{c}"' for c in VIEW_TABLE_COLS)
+# ※ 아래 로더에는 st.cache_data(persist="disk")를 쓰지 않음:
+#   Streamlit은 persist 캐시에서 ttl을 무시하므로 매출 데이터 10분 갱신이 깨짐
+#   (재시작 직후 첫 로드는 PostgreSQL 조회 1회로 감수)
+
 @st.cache_data(ttl=600)
 def load_view_table(months=36):
     # PostgreSQL에서 view_table 조회 (3년치 기본)
@@ -1113,18 +1175,19 @@ def load_view_table(months=36):
     
     # 선택된 개월 수만큼 데이터 로드
     if months >= 9999:
-        query = "SELECT * FROM view_table"
+        query = f"SELECT {VIEW_TABLE_SELECT} FROM view_table"
     else:
         cutoff = datetime.today() - relativedelta(months=months)
         cutoff_str = cutoff.strftime("%Y-%m-%d")
-        query = f"SELECT * FROM view_table WHERE 출고일자 >= '{cutoff_str}'"
+        query = f"SELECT {VIEW_TABLE_SELECT} FROM view_table WHERE 출고일자 >= '{cutoff_str}'"
     
     df = conn.query(query)
     
     df["출고일자"] = pd.to_datetime(df["출고일자"], errors="coerce")
     df["출고년월"] = df["출고년월"].astype(str).str.strip()
-    df["총내품출고수량"] = pd.to_numeric(df["총내품출고수량"], errors="coerce").fillna(0)
+    df["총내품출고수량"] = downcast_qty(pd.to_numeric(df["총내품출고수량"], errors="coerce").fillna(0))
     df["품목별매출(VAT제외)"] = pd.to_numeric(df["품목별매출(VAT제외)"], errors="coerce").fillna(0)
+    df = df.astype({c: ARROW_STR_DTYPE for c in ARROW_STR_COLS if c in df.columns})
     
     return df
 
@@ -1136,19 +1199,20 @@ def load_fin_view_table(months=36):
         conn = st.connection("postgresql", type="sql", url=DB_URL)
         
         if months >= 9999:
-            query = "SELECT * FROM fin_view_table"
+            query = f"SELECT {VIEW_TABLE_SELECT} FROM fin_view_table"
         else:
             cutoff = datetime.today() - relativedelta(months=months)
             cutoff_str = cutoff.strftime("%Y-%m-%d")
-            query = f"SELECT * FROM fin_view_table WHERE 출고일자 >= '{cutoff_str}'"
+            query = f"SELECT {VIEW_TABLE_SELECT} FROM fin_view_table WHERE 출고일자 >= '{cutoff_str}'"
         
         df = conn.query(query)
         
         if not df.empty:
             df["출고일자"] = pd.to_datetime(df["출고일자"], errors="coerce")
             df["출고년월"] = df["출고년월"].astype(str).str.strip()
-            df["총내품출고수량"] = pd.to_numeric(df["총내품출고수량"], errors="coerce").fillna(0)
+            df["총내품출고수량"] = downcast_qty(pd.to_numeric(df["총내품출고수량"], errors="coerce").fillna(0))
             df["품목별매출(VAT제외)"] = pd.to_numeric(df["품목별매출(VAT제외)"], errors="coerce").fillna(0)
+            df = df.astype({c: ARROW_STR_DTYPE for c in ARROW_STR_COLS if c in df.columns})
         return df
     except Exception as e:
         st.error(f"확정 데이터(fin_view_table) 로드 중 오류: {e}")
@@ -1156,8 +1220,7 @@ def load_fin_view_table(months=36):
 
 @st.cache_data(ttl=1800)
 def load_cost_master():
-    client = get_gspread_client()
-    ws     = client.open_by_key(SHEET_ID).worksheet("COST_MASTER")
+    ws     = get_spreadsheet(SHEET_ID).worksheet("COST_MASTER")
     data   = ws.get_all_values()
     result = {}
     for row in data[1:]:
@@ -1174,10 +1237,17 @@ def load_cost_master():
 
 @st.cache_data(ttl=1800)
 def load_master():
-    client = get_gspread_client()
-    item_ws  = client.open_by_key(SHEET_ID).worksheet("ITEM_MASTER")
-    item_df  = pd.DataFrame(item_ws.get_all_values()[1:], columns=item_ws.get_all_values()[0]).copy()
-    cust_ws  = client.open_by_key(SHEET_ID).worksheet("CUSTOMER_MASTER")
+    item_ws  = get_spreadsheet(SHEET_ID).worksheet("ITEM_MASTER")
+    # [최적화] 시트 값은 1회만 조회 (get_all_values 중복 호출 시 RPC·파싱 2배)
+    # build_dataset에서 쓰는 상품명/품목군 2개 컬럼만 DataFrame으로 구성
+    item_raw = item_ws.get_all_values()
+    item_hdr = [str(h).strip() for h in item_raw[0]] if item_raw else []
+    item_idx = [item_hdr.index(c) for c in ("상품명", "품목군") if c in item_hdr]
+    item_df  = pd.DataFrame(
+        [[r[i] if i < len(r) else "" for i in item_idx] for r in item_raw[1:]],
+        columns=[item_hdr[i] for i in item_idx],
+    )
+    cust_ws  = get_spreadsheet(SHEET_ID).worksheet("CUSTOMER_MASTER")
     cust_raw = cust_ws.get_all_values()
     cust_df  = pd.DataFrame(cust_raw[1:], columns=cust_raw[0]).copy()
     if "거래처분류" not in cust_df.columns:
@@ -1203,8 +1273,7 @@ def load_master():
 def load_sales_target():
     """채널별&월별 매출 목표 (2026) 시트에서 목표치 로드"""
     try:
-        client = get_gspread_client()
-        ws = client.open_by_key(SHEET_ID).worksheet("채널별&월별 매출 목표 (2026)")
+        ws = get_spreadsheet(SHEET_ID).worksheet("채널별&월별 매출 목표 (2026)")
         data = ws.get_all_values()
         
         records = []
@@ -1270,8 +1339,7 @@ def load_sales_target():
 def load_kpi_target():
     """KPI_TARGET 시트에서 연도별 목표매출액 로드. 시트 없으면 빈 dict 반환."""
     try:
-        client = get_gspread_client()
-        ws = client.open_by_key(SHEET_ID).worksheet("KPI_TARGET")
+        ws = get_spreadsheet(SHEET_ID).worksheet("KPI_TARGET")
         data = ws.get_all_values()
         if len(data) < 2:
             return {}
@@ -1315,8 +1383,7 @@ def load_auth_master():
     """AUTH_MASTER 시트 로드. 캐시 없음 (캐시 오염 방지).
     컬럼 구조: e-mail(A) | 담당부서(B) | 권한유형(C) | 품목군(D) | 비고(E)
     반환값: (auth_df, email_col, dept_col, role_type_col, item_group_col) 튜플."""
-    client = get_gspread_client()
-    ws   = client.open_by_key(SHEET_ID).worksheet("AUTH_MASTER")
+    ws   = get_spreadsheet(SHEET_ID).worksheet("AUTH_MASTER")
     data = ws.get_all_values()
     if not data or len(data) < 1:
         return pd.DataFrame(), None, None, None, None
@@ -1444,8 +1511,10 @@ def build_dataset(months=36):
     merged["연도"] = merged["출고일자"].dt.year
     merged["월"]   = merged["출고일자"].dt.month
     merged["주차"] = merged["출고일자"].dt.isocalendar().week.astype("Int64")
+    # [최적화] 출고년월 문자열은 캐시된 로드 단계에서 1회만 datetime으로 파싱 (하위 화면은 재파싱 없이 재사용)
+    merged["출고년월_dt"] = pd.to_datetime(merged["출고년월"] + "-01", errors="coerce")
     # [최적화] 벡터화된 날짜 연산으로 이전 달 년월 계산
-    merged["이전출고년월"] = (pd.to_datetime(merged["출고년월"] + "-01", errors="coerce") - pd.DateOffset(months=1)).dt.strftime("%Y-%m")
+    merged["이전출고년월"] = (merged["출고년월_dt"] - pd.DateOffset(months=1)).dt.strftime("%Y-%m")
     
     # [최적화] cost_dict를 DataFrame으로 변환 후 merge하여 apply 루프 제거
     cost_records = [{"이전출고년월": k[0], "내품상품명": k[1], "제품원가": v} for k, v in cost_dict.items()]
@@ -1535,14 +1604,76 @@ def allocate_costs(filtered_df, full_df, logistics_dict, ad_dict):
     res_df = res_df.drop(columns=["부서월매출합계", "물류비총액", "품목군월국내매출합계", "광고비총액"])
     return res_df
 
+FILTER_KEY_COLS = ["거래처분류", "내품상품명"]
+MONTH_AGG_COLS  = ["품목별매출(VAT제외)", "총내품출고수량", "매출총이익", "공헌이익"]
+
 @st.cache_data(ttl=600)
 def get_processed_dataset(months=36):
-    """데이터 로드 + 마스터 매핑 + 비용 배분까지 완료된 최종 데이터셋 반환"""
+    """데이터 로드 + 마스터 매핑 + 비용 배분까지 완료된 최종 데이터셋 반환
+    반환값: (df, filter_cats, month_cube, month_span, load_token)
+      - filter_cats: 필터 키 컬럼별 pd.Categorical (행 순서 = df 행 순서)
+      - month_cube : 월×채널×품목 합계 (MONTH_AGG_COLS)
+      - month_span : 월별 출고일자 min/max (기간 필터가 월 단위로 떨어지는지 판정용)
+      - load_token : 로드마다 새로 발급되는 식별자 (하위 캐시 키에 포함 → 재로드 시 이전 집계 무효화)"""
     df = build_dataset(months=months)
     l_dict, a_dict = load_cost_input(SHEET_ID)
     # 전체 데이터셋에 대해 비용 배분 수행
     df = allocate_costs(df, df, l_dict, a_dict)
-    return df
+    # [최적화] 필터 키 컬럼을 1회만 범주형 인코딩 → 매 rerun의 isin이 정수 codes 비교로 축소
+    # df 컬럼 dtype은 그대로 두어(groupby/pivot 결과 불변) codes는 별도로 보관
+    # 인덱스 라벨 = 행 위치(0..n-1) 보장 → 권한 필터 후에도 df.index로 codes 조회 가능
+    df = df.reset_index(drop=True)
+    # [최적화] merge 이후 object로 돌아온 그룹핑/필터 키를 Arrow string으로 재캐스팅 (반환 df까지 유지)
+    df = df.astype({c: ARROW_STR_DTYPE for c in DATASET_ARROW_STR_COLS if c in df.columns})
+    filter_cats = {c: pd.Categorical(df[c]) for c in FILTER_KEY_COLS}
+    # [최적화] 로드당 1회 월×채널×품목 사전 집계 → 필터 변경 시 원본 행 대신 작은 큐브만 슬라이스
+    # 출고일자 결측 행은 filtered_df의 기간 마스크에서 빠지므로 큐브·span에서도 제외
+    # 빈 로드는 allocate_costs가 비용 컬럼 없이 반환 → reindex로 빈 큐브 생성 (사이드바 df.empty 경고 유지)
+    dated = df[df["출고일자"].notna()].reindex(
+        columns=["출고년월", "출고일자"] + FILTER_KEY_COLS + MONTH_AGG_COLS
+    )
+    month_cube = dated.groupby(["출고년월"] + FILTER_KEY_COLS, sort=False)[MONTH_AGG_COLS].sum()
+    month_span = dated.groupby("출고년월", sort=False)["출고일자"].agg(["min", "max"])
+    return df, filter_cats, month_cube, month_span, uuid.uuid4().hex
+
+def slice_month_cube(month_cube, months, channels=None, items=None):
+    """사전 집계 큐브에서 월×채널 합계 추출. channels/items가 None이면 해당 축 전체."""
+    idx = month_cube.index
+    mask = idx.get_level_values("출고년월").isin(months)
+    if channels is not None:
+        mask &= idx.get_level_values("거래처분류").isin(channels)
+    if items is not None:
+        mask &= idx.get_level_values("내품상품명").isin(items)
+    return month_cube[mask].groupby(level=["출고년월", "거래처분류"], sort=False).sum()
+
+@st.cache_data(ttl=600)
+def get_month_channel_agg(_filtered_df, filter_key):
+    """filtered_df의 월×채널 합계 집계.
+    filter_key(로드 토큰·로드기간·권한범위·기간·채널·품목 선택 튜플)로만 캐시 → 같은 필터 상태 재방문 시 groupby 생략.
+    (_filtered_df는 해시 제외 — 같은 로드·같은 필터 상태면 내용도 같음)"""
+    return _filtered_df.groupby(["출고년월", "거래처분류"], sort=False)[MONTH_AGG_COLS].sum()
+
+@st.cache_data(ttl=600, max_entries=20)
+def build_download_excel(_filtered_df, _month_ch_agg, filter_key):
+    """다운로드 탭 통합 엑셀(bytes) 생성. get_month_channel_agg와 같은 filter_key(로드 토큰 포함)로 캐시.
+    항목마다 xlsx 바이트 전체를 보관하므로 max_entries로 상한."""
+    # 채널 피벗은 전역 월×채널 집계 재사용, 제품 피벗은 단일 groupby에서 unstack
+    _dl_prod_agg = _filtered_df.groupby(["내품상품명", "출고년월"], sort=False)[
+        ["품목별매출(VAT제외)", "총내품출고수량"]
+    ].sum()
+    dl_ch_sales = unstack_months(_month_ch_agg["품목별매출(VAT제외)"])
+    dl_ch_sales = dl_ch_sales.reindex(columns=sort_month_cols(dl_ch_sales.columns.tolist()))
+    dl_ch_qty = unstack_months(_month_ch_agg["총내품출고수량"])
+    dl_ch_qty = dl_ch_qty.reindex(columns=sort_month_cols(dl_ch_qty.columns.tolist()))
+    dl_prod_sales = unstack_months(_dl_prod_agg["품목별매출(VAT제외)"])
+    dl_prod_sales = dl_prod_sales.reindex(columns=sort_month_cols(dl_prod_sales.columns.tolist()))
+    dl_prod_qty = unstack_months(_dl_prod_agg["총내품출고수량"])
+    dl_prod_qty = dl_prod_qty.reindex(columns=sort_month_cols(dl_prod_qty.columns.tolist()))
+
+    return make_excel_file({
+        "월별채널매출": dl_ch_sales, "월별채널출고량": dl_ch_qty,
+        "월별제품매출": dl_prod_sales, "월별제품출고량": dl_prod_qty,
+    })
 
 # -----------------------------------
 # 초기화 및 세션 상태 관리
@@ -1561,7 +1692,7 @@ with st.sidebar:
     _months_map = {"최근 3년 (기본)": 36, "최근 5년": 60, "전체 데이터": 9999}
     _load_months = _months_map[_lookback_label]
 
-    df = get_processed_dataset(months=_load_months)
+    df, _filter_cats, _month_cube, _month_span, _load_token = get_processed_dataset(months=_load_months)
     # ── 권한 필터링 전의 원본 데이터를 백업 (예상 출고량 분석 탭 등에서 활용) ──
     full_raw_df = df.copy()
 
@@ -1626,10 +1757,12 @@ with st.sidebar:
         st.warning(f"⚠️ 귀하의 권한({st.session_state.get('user_dept', '')})에 해당하는 매출/출고 데이터가 없습니다. 관리자에게 문의하여 담당부서 권한 또는 해당 부서의 실적 데이터가 있는지 확인해 주세요.")
         st.stop()
 
-    client = get_gspread_client()
-    sh     = client.open_by_key(SHEET_ID)
-
     st.divider()
+    # 권한 필터 후 df 행의 원본 위치 (filter_cats codes 조회용). 권한 필터가 없으면 None → 전체 categories 사용
+    _row_pos = df.index.to_numpy()
+    _opt_pos = _row_pos if len(_row_pos) < len(_filter_cats["거래처분류"]) else None
+    _ch_all_cat, _item_all_cat = _filter_cats["거래처분류"], _filter_cats["내품상품명"]
+
     with st.expander("🔍 상세 필터 (채널/품목)", expanded=False):
         st.markdown("**🏪 채널 필터**")
         _user_role_type = st.session_state.get("user_role_type", "")
@@ -1645,8 +1778,8 @@ with st.sidebar:
                 disabled=True
             )
             # 부서기반은 강제로 자신의 부서 채널만 가져옴
-            _dept_filtered_channels = sorted(
-                df[df["담당부서"] == _user_dept_val]["거래처분류"].dropna().unique().tolist()
+            _dept_filtered_channels = present_categories(
+                _ch_all_cat, _row_pos[(df["담당부서"] == _user_dept_val).to_numpy()]
             )
         else:
             _all_depts = sorted(df["담당부서"].dropna().replace("", None).dropna().unique().tolist())
@@ -1657,13 +1790,15 @@ with st.sidebar:
                 key=f"filter_depts_{st.session_state['reset_count']}"
             )
             if selected_depts:
-                _dept_filtered_channels = sorted(
-                    df[df["담당부서"].isin(selected_depts)]["거래처분류"].dropna().unique().tolist()
+                _dept_filtered_channels = present_categories(
+                    _ch_all_cat, _row_pos[df["담당부서"].isin(selected_depts).to_numpy()]
                 )
             else:
-                _dept_filtered_channels = sorted(df["거래처분류"].dropna().unique().tolist())
+                _dept_filtered_channels = present_categories(_ch_all_cat, _opt_pos)
 
         _ch_select_all = st.checkbox("채널 전체 선택", value=True, key=f"ch_select_all_{st.session_state['reset_count']}")
+        # 부서·채널 모두 전체인 경우 → 전역 필터에서 채널 마스크 생략
+        _ch_filter_all = _ch_select_all and (_user_role_type == "부서기반" or not selected_depts)
         if _ch_select_all:
             selected_channel_groups = _dept_filtered_channels
         else:
@@ -1689,13 +1824,15 @@ with st.sidebar:
         )
 
         if selected_item_groups:
-            _ig_filtered_items = sorted(
-                df[df["품목군"].isin(selected_item_groups)]["내품상품명"].dropna().unique().tolist()
+            _ig_filtered_items = present_categories(
+                _item_all_cat, _row_pos[df["품목군"].isin(selected_item_groups).to_numpy()]
             )
         else:
-            _ig_filtered_items = sorted(df["내품상품명"].dropna().unique().tolist())
+            _ig_filtered_items = present_categories(_item_all_cat, _opt_pos)
 
         _item_select_all = st.checkbox("품목 전체 선택", value=True, key=f"item_select_all_{st.session_state['reset_count']}")
+        # 품목군·품목 모두 전체인 경우 → 전역 필터에서 품목 마스크 생략
+        _item_filter_all = _item_select_all and not selected_item_groups
         if _item_select_all:
             selected_items = _ig_filtered_items
         else:
@@ -1949,25 +2086,40 @@ selected_months    = sort_month_cols(_date_filtered_df["출고년월"].dropna().
 # filtered_df (이미 비용이 계산된 df에서 필터링만 수행)
 # -----------------------------------
 # 매출조정 행은 '전체 선택'일 때만 포함하고, 특정 품목 필터링 시에는 제외
-_is_adj_mask = df["내품상품명"].astype(str).str.strip() == "매출조정"
+# [최적화] 캐시된 범주형 codes + 룩업 벡터로 마스크 생성 (df.index = 원본 행 위치)
+_ch_cats    = _filter_cats["거래처분류"].categories
+_item_cats  = _filter_cats["내품상품명"].categories
+_ch_codes   = _filter_cats["거래처분류"].codes[_row_pos]
+_item_codes = _filter_cats["내품상품명"].codes[_row_pos]
+
+# [최적화] '전체 선택' 축은 isin 마스크 생략 (결측 키 행 제외만 유지)
+_comp_base_mask = None
+if not _ch_filter_all:
+    _comp_base_mask = codes_isin(_ch_codes, _ch_cats, selected_channel_groups)
+elif (_ch_codes < 0).any():
+    _comp_base_mask = _ch_codes >= 0
 
 # [수정] 매출조정 포함 조건: 품목군 필터가 비어있고 + 품목 전체 선택이 켜져 있을 때만 (즉, 완전 전체 조회일 때만)
-if (not selected_item_groups) and _item_select_all:
-    # 완전 전체 조회 시에는 매출조정 포함
-    _item_mask = df["내품상품명"].isin(selected_items) | _is_adj_mask
-else:
+# 완전 전체 조회 시에는 매출조정 포함 → 모든 품목 category가 선택되므로 결측만 제외
+if not _item_filter_all:
     # 특정 품목군 혹은 품목이 필터링된 경우 매출조정 제외
-    _item_mask = df["내품상품명"].isin(selected_items)
+    _item_mask = codes_isin(_item_codes, _item_cats, selected_items)
+elif (_item_codes < 0).any():
+    _item_mask = _item_codes >= 0
+else:
+    _item_mask = None
 
-_comp_base_mask = (
-    df["거래처분류"].isin(selected_channel_groups) & _item_mask
-)
-comparison_base_df = df[_comp_base_mask].copy()
+if _item_mask is not None:
+    _comp_base_mask = _item_mask if _comp_base_mask is None else (_comp_base_mask & _item_mask)
+_date_mask = df["출고일자"].between(_date_start_dt, _date_end_dt).to_numpy()
 
-filtered_df = comparison_base_df[
-    (comparison_base_df["출고일자"] >= _date_start_dt) &
-    (comparison_base_df["출고일자"] <= _date_end_dt)
-].copy()
+# 마스크당 1회 take (불리언 인덱싱 + .copy() 이중 복사 제거)
+if _comp_base_mask is None:
+    comparison_base_df = df
+    filtered_df        = df.take(np.flatnonzero(_date_mask))
+else:
+    comparison_base_df = df.take(np.flatnonzero(_comp_base_mask))
+    filtered_df        = df.take(np.flatnonzero(_comp_base_mask & _date_mask))
 
 if filtered_df.empty:
     st.warning("선택한 조건에 해당하는 데이터가 없습니다.")
@@ -2073,25 +2225,54 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-total_sales        = filtered_df["품목별매출(VAT제외)"].sum()
-total_qty          = filtered_df["총내품출고수량"].sum()
-total_gross_profit = filtered_df["매출총이익"].sum()
+# [최적화] 월×채널 단일 groupby(1회 해시) → KPI·대시보드 요약의 월별/채널별 집계는 여기서 파생
+# filtered_df에는 채널/출고년월 결측 행이 없으므로 단일 키 groupby와 결과 동일
+# 필터 상태 튜플로 캐시 → 위젯을 오가며 같은 조합으로 돌아오면 재집계 없음
+# 로드 토큰 포함 → 데이터/마스터 재로드 후에는 TTL과 무관하게 이전 로드의 집계를 재사용하지 않음
+_filter_key = (
+    _load_token,
+    _load_months,
+    st.session_state.get("user_role_type"),
+    st.session_state.get("user_dept"),
+    tuple(st.session_state.get("user_items", [])),
+    str(_date_start), str(_date_end),
+    None if _ch_filter_all else tuple(sorted(selected_channel_groups)),
+    None if _item_filter_all else tuple(sorted(selected_items)),
+)
+# [최적화] 권한 범위 = 전체이고 기간이 월 경계에 맞으면(선택 월의 모든 행이 기간 안) 사전 집계 큐브 슬라이스로 대체
+# 일 단위로 월을 자르는 기간·권한 부분집합은 큐브로 재현 불가 → 기존 groupby 경로
+_span_in = _month_span[_month_span.index.isin(selected_months)]
+if (
+    _opt_pos is None
+    and (_span_in["min"] >= _date_start_dt).all()
+    and (_span_in["max"] <= _date_end_dt).all()
+):
+    _month_ch_agg = slice_month_cube(
+        _month_cube, selected_months,
+        None if _ch_filter_all else selected_channel_groups,
+        None if _item_filter_all else selected_items,
+    )
+else:
+    _month_ch_agg = get_month_channel_agg(filtered_df, _filter_key)
+
+total_sales        = _month_ch_agg["품목별매출(VAT제외)"].sum()
+total_qty          = _month_ch_agg["총내품출고수량"].sum()
+total_gross_profit = _month_ch_agg["매출총이익"].sum()
 gross_profit_rate  = (total_gross_profit / total_sales * 100) if total_sales else 0
 
-monthly_kpi = filtered_df.groupby("출고년월", as_index=False)[["품목별매출(VAT제외)"]].sum()
-monthly_kpi["dt"] = pd.to_datetime(monthly_kpi["출고년월"] + "-01", errors="coerce")
-monthly_kpi = monthly_kpi.sort_values("dt")
-if len(monthly_kpi) >= 2:
-    cur, prv = monthly_kpi.iloc[-1]["품목별매출(VAT제외)"], monthly_kpi.iloc[-2]["품목별매출(VAT제외)"]
-    sales_mom = ((cur - prv) / prv * 100) if prv else 0
+monthly_agg = _month_ch_agg.groupby(level="출고년월").sum()
+channel_agg = _month_ch_agg.groupby(level="거래처분류").sum()
+
+# monthly_agg는 출고년월(YYYY-MM) 키 기준 정렬 → 시간순 정렬과 동일, 별도 datetime 파싱 불필요
+# 전월 대비: 마지막 2개 값만 NumPy 버퍼에서 직접 읽음 (iloc 행 Series 생성 없음)
+_monthly_sales = monthly_agg["품목별매출(VAT제외)"].to_numpy()
+if len(_monthly_sales) >= 2 and _monthly_sales[-2]:
+    sales_mom = (_monthly_sales[-1] - _monthly_sales[-2]) / _monthly_sales[-2] * 100
 else:
     sales_mom = 0
 
-_top_channel_series = (
-    filtered_df.groupby("거래처분류")["품목별매출(VAT제외)"]
-    .sum().sort_values(ascending=False)
-)
-top_channel = _top_channel_series.index[0] if not _top_channel_series.empty else "-"
+# 채널별 합계는 channel_agg에 이미 있음 → filtered_df 재그룹핑·정렬 없이 idxmax
+top_channel = channel_agg["품목별매출(VAT제외)"].idxmax() if len(channel_agg) else "-"
 
 def _fmt_money(v):
     """숫자를 억/천만 단위로 축약 표시. 예) 11,159,909,268 → 111.6억"""
@@ -2153,13 +2334,7 @@ if current_tab_key == "대시보드요약":
     # 섹션 1: 월별 매출 및 공헌이익 추이
     # ══════════════════════════════════════
     with st.expander("📈 월별 매출 및 공헌이익 추이", expanded=True):
-        _exec_monthly = (
-            filtered_df.groupby("출고년월", as_index=False)[
-                ["품목별매출(VAT제외)", "매출총이익", "공헌이익"]
-            ].sum()
-        )
-        _exec_monthly["dt"] = pd.to_datetime(_exec_monthly["출고년월"] + "-01", errors="coerce")
-        _exec_monthly = _exec_monthly.sort_values("dt")
+        _exec_monthly = monthly_agg.reset_index()
 
         _exec_fig = go.Figure()
         # 토글 상태에 따른 단위 변환
@@ -2200,10 +2375,7 @@ if current_tab_key == "대시보드요약":
     # 섹션 2: 채널 매출 집중도 리스크
     # ══════════════════════════════════════
     with st.expander("⚠️ 채널 매출 집중도 리스크", expanded=True):
-        _exec_ch_sales = (
-            filtered_df.groupby("거래처분류")["품목별매출(VAT제외)"]
-            .sum().sort_values(ascending=False)
-        )
+        _exec_ch_sales = channel_agg["품목별매출(VAT제외)"].sort_values(ascending=False)
         if not _exec_ch_sales.empty and total_sales > 0:
             _top3_sales = _exec_ch_sales.head(3).sum()
             _top3_rate  = _top3_sales / total_sales * 100
@@ -2218,13 +2390,24 @@ if current_tab_key == "대시보드요약":
             st.caption("📌 Top 3 집중도 70% 이상이면 특정 채널 이탈 시 매출 타격이 큽니다.")
 
             # 채널별 매출 비중 바차트 (각 바에 비중% 라벨 표시)
+            # 상위 30개 채널만 개별 표시하고 나머지는 '기타'로 합산 → 브라우저 렌더링 바 개수 상한
+            _CONC_TOP_N = 30
             _conc_df = _exec_ch_sales.reset_index()
             _conc_df.columns = ["채널", "매출"]
+            _conc_has_other = len(_conc_df) > _CONC_TOP_N
+            if _conc_has_other:
+                _conc_other = _conc_df["매출"].iloc[_CONC_TOP_N:].sum()
+                _conc_df = pd.concat(
+                    [_conc_df.head(_CONC_TOP_N), pd.DataFrame([{"채널": "기타", "매출": _conc_other}])],
+                    ignore_index=True,
+                )
             _conc_df["비중(%)"] = _conc_df["매출"] / total_sales * 100
             _conc_colors = (
                 ["#ef4444"] * 1 + ["#f97316"] * 2 + ["#60a5fa"] * (len(_conc_df) - 3)
                 if len(_conc_df) >= 3 else ["#60a5fa"] * len(_conc_df)
             )
+            if _conc_has_other:
+                _conc_colors[-1] = "#9ca3af"
             _conc_fig = go.Figure(go.Bar(
                 x=_conc_df["채널"], y=_conc_df["매출"],
                 marker_color=_conc_colors,
@@ -2240,7 +2423,7 @@ if current_tab_key == "대시보드요약":
                 yaxis=dict(title="매출액 (원)"),
                 annotations=[dict(
                     x=0.01, y=1.06, xref="paper", yref="paper",
-                    text="🔴 1위  🟠 2~3위  🔵 나머지",
+                    text="🔴 1위  🟠 2~3위  🔵 나머지" + (f"  ⚪ 기타({_CONC_TOP_N + 1}위~)" if _conc_has_other else ""),
                     showarrow=False, font=dict(size=11, color="#6b7280"),
                 )],
             )
@@ -2251,22 +2434,18 @@ if current_tab_key == "대시보드요약":
     # ══════════════════════════════════════
     with st.expander("🌡️ 채널별 공헌이익률 히트맵 (채널 × 월)", expanded=True):
         st.caption("색이 진할수록 공헌이익률이 높습니다. 빨간색은 적자 채널입니다. (매출 상위 15개 채널)")
-        _hm_df = (
-            filtered_df.groupby(["거래처분류", "출고년월"])[["품목별매출(VAT제외)", "공헌이익"]]
-            .sum().reset_index()
-        )
+        _hm_df = _month_ch_agg[["품목별매출(VAT제외)", "공헌이익"]].copy()
         _hm_df["공헌이익률(%)"] = np.where(
             _hm_df["품목별매출(VAT제외)"] != 0,
             _hm_df["공헌이익"] / _hm_df["품목별매출(VAT제외)"] * 100, 0,
         )
         if not _hm_df.empty:
-            _hm_pivot = _hm_df.pivot_table(
-                index="거래처분류", columns="출고년월", values="공헌이익률(%)", aggfunc="mean"
-            )
+            # (채널, 월) 키가 이미 유일 → pivot_table(aggfunc="mean") 대신 unstack
+            _hm_pivot = unstack_months(_hm_df["공헌이익률(%)"], fill_value=None)
             _hm_month_cols = sort_month_cols(_hm_pivot.columns.tolist())
             _hm_pivot = _hm_pivot[_hm_month_cols]
             _top_ch_for_hm = (
-                filtered_df.groupby("거래처분류")["품목별매출(VAT제외)"].sum()
+                channel_agg["품목별매출(VAT제외)"]
                 .sort_values(ascending=False).head(15).index.tolist()
             )
             _hm_pivot = _hm_pivot.loc[_hm_pivot.index.isin(_top_ch_for_hm)]
@@ -2295,16 +2474,14 @@ if current_tab_key == "대시보드요약":
         _ig_hm_df = (
             filtered_df[~filtered_df["품목군"].isin(["__매출조정__", "__미분류__"])]
             .groupby(["품목군", "출고년월"])[["품목별매출(VAT제외)", "공헌이익"]]
-            .sum().reset_index()
+            .sum()
         )
         _ig_hm_df["공헌이익률(%)"] = np.where(
             _ig_hm_df["품목별매출(VAT제외)"] != 0,
             _ig_hm_df["공헌이익"] / _ig_hm_df["품목별매출(VAT제외)"] * 100, 0,
         )
         if not _ig_hm_df.empty:
-            _ig_hm_pivot = _ig_hm_df.pivot_table(
-                index="품목군", columns="출고년월", values="공헌이익률(%)", aggfunc="mean"
-            )
+            _ig_hm_pivot = unstack_months(_ig_hm_df["공헌이익률(%)"], fill_value=None)
             _ig_hm_month_cols = sort_month_cols(_ig_hm_pivot.columns.tolist())
             _ig_hm_pivot = _ig_hm_pivot[_ig_hm_month_cols]
             _ig_hm_fig = go.Figure(go.Heatmap(
@@ -2546,15 +2723,14 @@ if current_tab_key == "월별추이":
                 ["품목별매출(VAT제외)", "매출총이익", "총내품출고수량"]
             ].sum()
         )
-        monthly["dt"] = pd.to_datetime(monthly["출고년월"] + "-01", errors="coerce")
-        monthly = monthly.sort_values("dt").rename(columns={
+        # groupby 결과는 출고년월(YYYY-MM) 키 기준 정렬 → 이미 시간순
+        monthly = monthly.rename(columns={
             "품목별매출(VAT제외)": "매출액", "총내품출고수량": "출고량"
         })
 
         def get_prev_year_sales(ym):
             try:
-                dt = pd.to_datetime(ym + "-01")
-                prev_ym = (dt - relativedelta(years=1)).strftime("%Y-%m")
+                prev_ym = f"{int(ym[:4]) - 1}{ym[4:]}"
                 return _comp_monthly.get(prev_ym, None)
             except:
                 return None
@@ -2758,6 +2934,8 @@ if current_tab_key == "월별추이":
                 y=_cm_val_col,
                 color="거래처분류",
                 markers=True,
+                # 직접 선택 시 트레이스 수가 채널 수만큼 늘어남 → SVG 대신 WebGL(scattergl)로 렌더링
+                render_mode="webgl",
                 labels={
                     "출고년월": "출고년월",
                     _cm_val_col: _cm_metric,
@@ -2951,9 +3129,9 @@ if current_tab_key == "주차별추이":
 
     # ── 일별 상세 추이 (expander) ──
     with st.expander("📅 일별 상세 추이", expanded=False):
-        _daily_df = filtered_df.copy()
-        _daily_df = _daily_df.dropna(subset=["출고일자"])
-        _daily_df["출고일자_date"] = _daily_df["출고일자"].dt.date
+        # 일 단위 키는 datetime64 그대로 normalize (Python date 객체 변환·재파싱 없음)
+        _daily_df = filtered_df.dropna(subset=["출고일자"])
+        _daily_df = _daily_df.assign(출고일자_date=_daily_df["출고일자"].dt.normalize())
 
         _d_c1, _d_c2, _d_c3 = st.columns([2, 2, 3])
         with _d_c1:
@@ -2994,7 +3172,6 @@ if current_tab_key == "주차별추이":
             _daily_df.groupby("출고일자_date", as_index=False)[_d_val_col].sum()
             .sort_values("출고일자_date")
         )
-        _daily_agg["출고일자_date"] = pd.to_datetime(_daily_agg["출고일자_date"])
 
         # 최근 N일 슬라이싱
         _daily_agg = _daily_agg.tail(_d_days).copy()
@@ -3249,10 +3426,8 @@ if current_tab_key == "채널분석":
                 else:
                     st.error(f"프리셋 삭제 실패: {msg}")
 
-    ch_sales_pivot = pd.pivot_table(
-        filtered_df, values="품목별매출(VAT제외)", index="거래처분류",
-        columns="출고년월", aggfunc="sum", fill_value=0
-    )
+    # [최적화] 전역 월×채널 집계(_month_ch_agg) 재사용 → filtered_df 재스캔 없음
+    ch_sales_pivot = unstack_months(_month_ch_agg["품목별매출(VAT제외)"])
     ch_sales_mcols = sort_month_cols(ch_sales_pivot.columns.tolist())
     ch_sales_pivot = ch_sales_pivot.reindex(columns=ch_sales_mcols)
     ch_month_totals = ch_sales_pivot.sum()
@@ -3345,10 +3520,7 @@ if current_tab_key == "채널분석":
 
     st.subheader("📦 월별 채널별 출고량")
 
-    ch_qty_pivot = pd.pivot_table(
-        filtered_df, values="총내품출고수량", index="거래처분류",
-        columns="출고년월", aggfunc="sum", fill_value=0
-    )
+    ch_qty_pivot = unstack_months(_month_ch_agg["총내품출고수량"])
     ch_qty_mcols = sort_month_cols(ch_qty_pivot.columns.tolist())
     ch_qty_pivot = ch_qty_pivot.reindex(columns=ch_qty_mcols)
     ch_qty_pivot = add_total_row(ch_qty_pivot)
@@ -3357,7 +3529,8 @@ if current_tab_key == "채널분석":
     # [수정] 데이터타입 강제 변환 (안전한 포맷팅 위해)
     ch_qty_pivot = ch_qty_pivot.apply(pd.to_numeric, errors='coerce').fillna(0)
     
-    st.dataframe(ch_qty_pivot.style.format("{:,.0f}"), use_container_width=True)
+    _ch_qty_view, _ch_qty_cfg = int_table_view(ch_qty_pivot)
+    st.dataframe(_ch_qty_view, column_config=_ch_qty_cfg, use_container_width=True)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -3406,16 +3579,14 @@ if current_tab_key == "제품분석":
 
     st.subheader("💰 월별 제품별 매출액 및 구성비 / 개당 단가")
     filt_top = filtered_df[filtered_df["내품상품명"].isin(top_products["내품상품명"])]
-    prod_s_pivot = pd.pivot_table(
-        filt_top, values="품목별매출(VAT제외)", index="내품상품명",
-        columns="출고년월", aggfunc="sum", fill_value=0
-    )
+    # [최적화] 매출·출고량 피벗 3종을 단일 groupby에서 unstack
+    prod_month_agg = filt_top.groupby(["내품상품명", "출고년월"], sort=False)[
+        ["품목별매출(VAT제외)", "총내품출고수량"]
+    ].sum()
+    prod_s_pivot = unstack_months(prod_month_agg["품목별매출(VAT제외)"])
     prod_s_mcols = sort_month_cols(prod_s_pivot.columns.tolist())
     prod_s_pivot = prod_s_pivot.reindex(columns=prod_s_mcols)
-    prod_q_by_month = pd.pivot_table(
-        filt_top, values="총내품출고수량", index="내품상품명",
-        columns="출고년월", aggfunc="sum", fill_value=0
-    ).reindex(columns=prod_s_mcols, fill_value=0)
+    prod_q_by_month = unstack_months(prod_month_agg["총내품출고수량"]).reindex(columns=prod_s_mcols, fill_value=0)
     prod_month_totals = prod_s_pivot.sum()
     prod_s_pivot     = add_total_row(prod_s_pivot)
     prod_q_by_month  = add_total_row(prod_q_by_month)
@@ -3480,15 +3651,13 @@ if current_tab_key == "제품분석":
         st.dataframe(prod_display.style.format(prod_display_fmt), use_container_width=True)
 
     st.subheader("📦 월별 제품별 출고량")
-    prod_q_pivot = pd.pivot_table(
-        filt_top, values="총내품출고수량", index="내품상품명",
-        columns="출고년월", aggfunc="sum", fill_value=0
-    )
+    prod_q_pivot = unstack_months(prod_month_agg["총내품출고수량"])
     prod_q_mcols = sort_month_cols(prod_q_pivot.columns.tolist())
     prod_q_pivot = prod_q_pivot.reindex(columns=prod_q_mcols)
     prod_q_pivot = add_total_row(prod_q_pivot)
     prod_q_pivot = sort_pivot_by_last_month(prod_q_pivot, prod_q_mcols)
-    st.dataframe(prod_q_pivot.style.format("{:,.0f}"), use_container_width=True)
+    _prod_q_view, _prod_q_cfg = int_table_view(prod_q_pivot)
+    st.dataframe(_prod_q_view, column_config=_prod_q_cfg, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
 # ===================================
@@ -3545,8 +3714,11 @@ if current_tab_key == "YoY분석":
         base_year = str(int(sel_year)-1)
         end_mm = sel_end_month.split("-")[1]
         
-        target_mask = (df["출고년월"].str[:4] == target_year) & (df["출고년월"].str[5:7] <= end_mm)
-        base_mask = (df["출고년월"].str[:4] == base_year) & (df["출고년월"].str[5:7] <= end_mm)
+        # 캐시 단계에서 파싱된 출고년월_dt 사용 (행 단위 문자열 슬라이싱 제거)
+        _ym_year  = df["출고년월_dt"].dt.year
+        _ym_month = df["출고년월_dt"].dt.month
+        target_mask = (_ym_year == int(target_year)) & (_ym_month <= int(end_mm))
+        base_mask = (_ym_year == int(base_year)) & (_ym_month <= int(end_mm))
         
         target_df = df[target_mask]
         base_df = df[base_mask]
@@ -3566,11 +3738,11 @@ if current_tab_key == "YoY분석":
         
         st.caption(f"비교 기준 기간: {base_start} ~ {base_end}")
         
-        df_tmp = df.copy()
-        df_tmp["출고일자_dt"] = pd.to_datetime(df_tmp["출고일자"], errors='coerce')
-        
-        target_df = df_tmp[(df_tmp["출고일자_dt"].dt.date >= start_d) & (df_tmp["출고일자_dt"].dt.date <= end_d)]
-        base_df = df_tmp[(df_tmp["출고일자_dt"].dt.date >= base_start) & (df_tmp["출고일자_dt"].dt.date <= base_end)]
+        # 출고일자는 로드 시 이미 datetime → 전체 복사/재파싱/.dt.date 객체 변환 없이 Timestamp 비교
+        _ship_dt = df["출고일자"]
+        _one_day = pd.Timedelta(days=1)
+        target_df = df[(_ship_dt >= pd.Timestamp(start_d)) & (_ship_dt < pd.Timestamp(end_d) + _one_day)]
+        base_df = df[(_ship_dt >= pd.Timestamp(base_start)) & (_ship_dt < pd.Timestamp(base_end) + _one_day)]
         target_label = f"{start_d}~{end_d}"
         base_label = f"{base_start}~{base_end}"
 
@@ -4408,7 +4580,8 @@ if current_tab_key == "공헌이익분석(통합)":
                     row[m] = _lt.get((dept, m), 0)
                 _logistics_rows.append(row)
             _logistics_display = pd.DataFrame(_logistics_rows).set_index("부서")
-            st.dataframe(_logistics_display.style.format("{:,.0f}"), use_container_width=True)
+            _logistics_view, _logistics_cfg = int_table_view(_logistics_display)
+            st.dataframe(_logistics_view, column_config=_logistics_cfg, use_container_width=True)
         else:
             st.info("COST_INPUT 시트에 물류비 데이터가 없습니다.")
 
@@ -4710,8 +4883,7 @@ if current_tab_key == "예상출고량분석":
     @st.cache_data(ttl=600)
     def load_item_master_details():
         try:
-            client = get_gspread_client()
-            ws = client.open_by_key(SHEET_ID).worksheet("ITEM_MASTER")
+            ws = get_spreadsheet(SHEET_ID).worksheet("ITEM_MASTER")
             data = ws.get_all_values()
             if not data or len(data) < 2:
                 return pd.DataFrame(columns=["상품명", "리드타임(일)", "MOQ"])
@@ -4956,18 +5128,22 @@ if current_tab_key == "예상출고량분석":
             - **리드타임(일) & MOQ**: 발주 시 참고할 상품 마스터 정보입니다. (입고 소요일 및 최소주문수량)
             """)
 
-        def highlight_stock_status(row):
-            status = row["재고 상태"]
-            if status == "부족":
-                return ['background-color: #fee2e2'] * len(row) # 연한 빨강
-            elif status == "과잉":
-                return ['background-color: #fef3c7'] * len(row) # 연한 노랑/주황
-            elif status == "정상":
-                return ['background-color: #dcfce7'] * len(row) # 연한 초록
-            return [''] * len(row)
+        _STOCK_STATUS_BG = {
+            "부족": "background-color: #fee2e2", # 연한 빨강
+            "과잉": "background-color: #fef3c7", # 연한 노랑/주황
+            "정상": "background-color: #dcfce7", # 연한 초록
+        }
+
+        def highlight_stock_status(frame):
+            # [최적화] 행별 Python 호출(axis=1) 대신 상태 컬럼 map 1회 → 스타일 배열 일괄 생성 (axis=None)
+            row_css = frame["재고 상태"].map(_STOCK_STATUS_BG).fillna("").to_numpy(dtype=object)
+            return pd.DataFrame(
+                np.repeat(row_css[:, None], frame.shape[1], axis=1),
+                index=frame.index, columns=frame.columns,
+            )
 
         st.dataframe(
-            disp_predict.style.apply(highlight_stock_status, axis=1).format({
+            disp_predict.style.apply(highlight_stock_status, axis=None).format({
                 "일평균 출고량": "{:,.1f}",
                 "예상 필요수량": "{:,.0f}",
                 "업로드 시점 재고": "{:,.0f}",
@@ -5185,23 +5361,8 @@ if current_tab_key == "다운로드":
     st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
     st.subheader("📥 다운로드")
 
-    dl_ch_sales = pd.pivot_table(filtered_df, values="품목별매출(VAT제외)", index="거래처분류",
-                                  columns="출고년월", aggfunc="sum", fill_value=0)
-    dl_ch_sales = dl_ch_sales.reindex(columns=sort_month_cols(dl_ch_sales.columns.tolist()))
-    dl_ch_qty = pd.pivot_table(filtered_df, values="총내품출고수량", index="거래처분류",
-                                columns="출고년월", aggfunc="sum", fill_value=0)
-    dl_ch_qty = dl_ch_qty.reindex(columns=sort_month_cols(dl_ch_qty.columns.tolist()))
-    dl_prod_sales = pd.pivot_table(filtered_df, values="품목별매출(VAT제외)", index="내품상품명",
-                                    columns="출고년월", aggfunc="sum", fill_value=0)
-    dl_prod_sales = dl_prod_sales.reindex(columns=sort_month_cols(dl_prod_sales.columns.tolist()))
-    dl_prod_qty = pd.pivot_table(filtered_df, values="총내품출고수량", index="내품상품명",
-                                  columns="출고년월", aggfunc="sum", fill_value=0)
-    dl_prod_qty = dl_prod_qty.reindex(columns=sort_month_cols(dl_prod_qty.columns.tolist()))
-
-    download_file = make_excel_file({
-        "월별채널매출": dl_ch_sales, "월별채널출고량": dl_ch_qty,
-        "월별제품매출": dl_prod_sales, "월별제품출고량": dl_prod_qty,
-    })
+    # [최적화] 로드·필터 상태별 캐시 → 같은 조건의 rerun마다 피벗·엑셀 변환을 반복하지 않음
+    download_file = build_download_excel(filtered_df, _month_ch_agg, _filter_key)
     st.download_button(
         label="📥 분석 결과 통합 엑셀 다운로드",
         data=download_file,
@@ -5358,8 +5519,7 @@ if current_tab_key == "admin_setting":
         # [신규] ITEM_MASTER에서 품목군 목록 로드 (관리자 UI용)
         @st.cache_data(ttl=1800)
         def load_item_group_list():
-            _client  = get_gspread_client()
-            _ws      = _client.open_by_key(SHEET_ID).worksheet("ITEM_MASTER")
+            _ws      = get_spreadsheet(SHEET_ID).worksheet("ITEM_MASTER")
             _data    = _ws.get_all_values()
             if not _data or len(_data) < 2:
                 return []
@@ -5610,8 +5770,7 @@ if current_tab_key == "제품별원가":
 
     @st.cache_data(ttl=1800)
     def load_cost_master_table():
-        client = get_gspread_client()
-        ws   = client.open_by_key(SHEET_ID).worksheet("COST_MASTER")
+        ws   = get_spreadsheet(SHEET_ID).worksheet("COST_MASTER")
         data = ws.get_all_values()
         if not data or len(data) < 2:
             return pd.DataFrame()